@@ -27,9 +27,9 @@ MATCH_DATA_FILE = os.path.join(DATA_DIR, "match_data.json")
 class DatabaseManager:
     """Manager for database operations"""
     
-    def __init__(self):
-        """Initialize database manager with a session"""
-        self.session = get_session()
+    def __init__(self, session: Optional[Session] = None):
+        """Initialize database manager with the given session, or a new one"""
+        self.session = session if session is not None else get_session()
     
     def close(self):
         """Close the database session"""
@@ -175,6 +175,14 @@ class DatabaseManager:
         """Get a player by name"""
         return self.session.query(Player).filter_by(name=name).first()
     
+    def get_players_by_names(self, names: List[str]) -> List[Player]:
+        """Get players by name in one query, in the order of names (unknown names are skipped)"""
+        by_name = {}
+        for player in self.session.query(Player).filter(Player.name.in_(set(names))).all():
+            # Keep the first match per name, like get_player_by_name
+            by_name.setdefault(player.name, player)
+        return [by_name[name] for name in names if name in by_name]
+    
     def get_players_by_role(self, role: str) -> List[Player]:
         """Get players by role"""
         return self.session.query(Player).filter_by(role=role).all()
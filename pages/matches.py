@@ -5,13 +5,8 @@ Matches page - Shows upcoming and live cricket matches
 import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
-import sys
-import os
 import logging
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 # Import from parent directory
 from cricket_data_adapter import get_live_cricket_matches, get_upcoming_matches
 from logger import get_logger, ErrorHandler
@@ -4,15 +4,8 @@ Players page - Shows player statistics and analysis
 
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import sys
-import os
 import logging
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 # Import from parent directory
 from cricket_data_adapter import get_player_stats, get_player_form, get_recommended_players
 from visualizations import player_performance_chart
@@ -21,6 +14,38 @@ from logger import get_logger, ErrorHandler
 # Set up logging
 logger = get_logger(__name__)
 
+def _batsman_insights(player_data):
+    """Insights for batsmen based on strike rate and average"""
+    insights = []
+    if player_data.get('strike_rate', 0) > 140:
+        insights.append("⚡ High strike rate makes this player excellent for T20 formats")
+    if player_data.get('batting_avg', 0) > 45:
+        insights.append("📊 High batting average indicates consistency")
+    return insights
+
+def _bowler_insights(player_data):
+    """Insights for bowlers based on economy and average"""
+    insights = []
+    if player_data.get('economy', 0) < 7:
+        insights.append("🎯 Good economy rate makes this bowler valuable in all formats")
+    if player_data.get('bowling_avg', 0) < 25:
+        insights.append("🔝 Excellent bowling average indicates wicket-taking ability")
+    return insights
+
+# Role-specific insight generators
+ROLE_DISPATCH = {
+    "Batsman": _batsman_insights,
+    "Bowler": _bowler_insights,
+    "All-rounder": lambda player_data: ["🌟 All-rounders often provide excellent value in fantasy cricket"],
+    "Wicketkeeper": lambda player_data: ["🧤 Wicketkeepers who bat well are premium fantasy assets"],
+}
+
+def _value_rating(player_data):
+    """Fantasy points per unit price, or None if either is missing or zero"""
+    fantasy_pts = player_data.get('fantasy_points_avg')
+    price = player_data.get('price')
+    return fantasy_pts / price if fantasy_pts and price else None
+
 # Page configuration
 st.set_page_config(
     page_title="Player Stats | Fantasy Cricket Assistant",
@@ -53,6 +78,8 @@ with tab1:
                 if player_data and player_data.get('name') != 'Unknown':
                     st.success(f"Found player: {player_data.get('name')}")
                     
+                    value = _value_rating(player_data)
+                    
                     # Display player info in columns
                     col1, col2 = st.columns([2, 1])
                     
@@ -103,9 +130,7 @@ with tab1:
                         st.metric("Ownership", f"{player_data.get('ownership', 0):.1f}%")
                         st.metric("Price", f"{player_data.get('price', 0):.1f}")
                         
-                        # Calculate value (points per unit price)
-                        if player_data.get('fantasy_points_avg') and player_data.get('price'):
-                            value = player_data.get('fantasy_points_avg') / player_data.get('price')
+                        if value is not None:
                             st.metric("Value Rating", f"{value:.2f}")
                     
                     # Show performance chart
@@ -134,6 +159,8 @@ with tab2:
                 if player_data and player_data.get('name') != 'Unknown':
                     st.success(f"Analyzing: {player_data.get('name')}")
                     
+                    value = _value_rating(player_data)
+                    
                     # Show performance chart
                     player_performance_chart(player_name_analysis)
                     
@@ -156,25 +183,12 @@ with tab2:
                         insights.append("⛔ Player is in poor form - avoid unless you expect a turnaround")
                     
                     # Role-specific insights
-                    role = player_data.get('role', 'Unknown')
-                    if role == "Batsman":
-                        if player_data.get('strike_rate', 0) > 140:
-                            insights.append("⚡ High strike rate makes this player excellent for T20 formats")
-                        if player_data.get('batting_avg', 0) > 45:
-                            insights.append("📊 High batting average indicates consistency")
-                    elif role == "Bowler":
-                        if player_data.get('economy', 0) < 7:
-                            insights.append("🎯 Good economy rate makes this bowler valuable in all formats")
-                        if player_data.get('bowling_avg', 0) < 25:
-                            insights.append("🔝 Excellent bowling average indicates wicket-taking ability")
-                    elif role == "All-rounder":
-                        insights.append("🌟 All-rounders often provide excellent value in fantasy cricket")
-                    elif role == "Wicketkeeper":
-                        insights.append("🧤 Wicketkeepers who bat well are premium fantasy assets")
+                    role_insights = ROLE_DISPATCH.get(player_data.get('role', 'Unknown'))
+                    if role_insights:
+                        insights.extend(role_insights(player_data))
                     
                     # Value assessment
-                    if player_data.get('fantasy_points_avg') and player_data.get('price'):
-                        value = player_data.get('fantasy_points_avg') / player_data.get('price')
+                    if value is not None:
                         if value > 10:
                             insights.append("💰 Excellent value for price - strongly recommended")
                         elif value > 8:
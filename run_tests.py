@@ -1,7 +1,14 @@
-import unittest
 import os
 import sys
 import logging
+import pytest
+
+# Run test files in parallel when pytest-xdist is installed
+try:
+    import xdist
+    XDIST_AVAILABLE = True
+except ImportError:
+    XDIST_AVAILABLE = False
 
 # Disable logging during tests
 logging.disable(logging.CRITICAL)
@@ -14,16 +21,12 @@ def run_tests():
     # Add the script directory to the Python path
     sys.path.insert(0, script_dir)
     
-    # Discover and run tests
-    test_loader = unittest.TestLoader()
-    test_suite = test_loader.discover('tests', pattern='test_*.py')
-    
-    # Run tests
-    test_runner = unittest.TextTestRunner(verbosity=2)
-    result = test_runner.run(test_suite)
-    
-    # Return exit code based on test result
-    return 0 if result.wasSuccessful() else 1
+    # Discover and run tests (pytest also collects unittest-style classes)
+    args = ['-v', os.path.join(script_dir, 'tests')]
+    if XDIST_AVAILABLE:
+        # loadfile keeps each module on one worker so its module/session fixtures stay warm
+        args += ['-n', 'auto', '--dist=loadfile']
+    return int(pytest.main(args))
 
 if __name__ == '__main__':
     sys.exit(run_tests())
@@ -4,6 +4,7 @@ Test script for cricket data sources
 
 import logging
 import json
+import sys
 from typing import Dict, List, Any
 import os
 
@@ -36,7 +37,8 @@ import cricket_data_adapter as adapter
 
 def pretty_print(data: Any) -> None:
     """Pretty print data"""
-    print(json.dumps(data, indent=2))
+    json.dump(data, sys.stdout, indent=2, default=str)
+    sys.stdout.write("\n")
 
 def test_cricsheet():
     """Test Cricsheet data source"""
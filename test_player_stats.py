@@ -4,97 +4,138 @@ Test script to verify player statistics functionality
 
 import os
 import json
+import time
+import string
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Per-query output is logged at DEBUG; set VERBOSE=1 (or run pytest with
+# -o log_cli_level=DEBUG) to see it
+if os.environ.get("VERBOSE"):
+    logger.setLevel(logging.DEBUG)
+
 # Import the necessary functions
 from cricket_data_adapter import get_player_stats
-from gemini_assistant import extract_player_name, get_formatted_player_stats
+from gemini_assistant import extract_player_name as _extract_player_name, get_formatted_player_stats
+
+# Maps ASCII names to their cache-file form ("Virat Kohli" -> "virat_kohli") in one pass
+_NORM_TABLE = str.maketrans(string.ascii_uppercase + " ", string.ascii_lowercase + "_")
+
+# Name extraction only depends on the query text, so memoize it across tests
+extract_player_name = lru_cache(maxsize=512)(_extract_player_name)
+
+TEST_QUERIES = (
+    "What are Virat Kohli's batting statistics?",
+    "Show me stats for Rohit Sharma",
+    "Tell me about Jasprit Bumrah's bowling performance",
+    "MS Dhoni's career statistics",
+    "Kane Williamson form",
+    "How is Babar Azam performing?",
+    "Ben Stokes recent matches",
+    "Steve Smith batting average"
+)
+
+TEST_PLAYERS = (
+    "Virat Kohli",
+    "Rohit Sharma",
+    "Jasprit Bumrah",
+    "MS Dhoni",
+    "Kane Williamson"
+)
+
+# Age below which cricket_data_adapter.get_player_stats reads a player cache file as-is
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+FORMATTED_OUTPUT_PLAYERS = (
+    "Virat Kohli",
+    "Jasprit Bumrah"
+)
 
 def test_player_extraction():
     """Test the player name extraction function"""
-    test_queries = [
-        "What are Virat Kohli's batting statistics?",
-        "Show me stats for Rohit Sharma",
-        "Tell me about Jasprit Bumrah's bowling performance",
-        "MS Dhoni's career statistics",
-        "Kane Williamson form",
-        "How is Babar Azam performing?",
-        "Ben Stokes recent matches",
-        "Steve Smith batting average"
-    ]
-    
-    print("\n=== Testing Player Name Extraction ===")
-    for query in test_queries:
+    logger.debug("=== Testing Player Name Extraction ===")
+    for query in TEST_QUERIES:
         player_name = extract_player_name(query)
-        print(f"Query: '{query}' -> Extracted: '{player_name}'")
-    
-    print("\n")
+        logger.debug(f"Query: '{query}' -> Extracted: '{player_name}'")
 
 def test_player_stats_retrieval():
     """Test the player statistics retrieval function"""
-    test_players = [
-        "Virat Kohli",
-        "Rohit Sharma",
-        "Jasprit Bumrah",
-        "MS Dhoni",
-        "Kane Williamson"
-    ]
+    logger.debug("=== Testing Player Stats Retrieval ===")
     
-    print("\n=== Testing Player Stats Retrieval ===")
-    for player in test_players:
-        print(f"\nRetrieving stats for {player}...")
-        
-        # Check if we have cached data
-        normalized_name = player.lower().replace(" ", "_")
-        cache_file = os.path.join("cricsheet_data/cache", f"player_{normalized_name}.json")
-        
-        if os.path.exists(cache_file):
-            cache_age = datetime.fromtimestamp(os.path.getmtime(cache_file))
-            print(f"Found cached data from {cache_age}")
+    # Index the cache directory once instead of stat-ing each player file
+    cache_dir = "cricsheet_data/cache"
+    cache_index = {}
+    if os.path.isdir(cache_dir):
+        with os.scandir(cache_dir) as entries:
+            cache_index = {entry.name: entry for entry in entries}
+    
+    # Report cached data up front; cache hits are read concurrently below
+    cached_players = set()
+    for player in TEST_PLAYERS:
+        normalized_name = player.translate(_NORM_TABLE)
         
-        # Get stats (force refresh for first player to test download)
-        force_refresh = (player == test_players[0])
-        stats = get_player_stats(player, force_refresh=force_refresh)
+        if cache_entry := cache_index.get(f"player_{normalized_name}.json"):
+            mtime = cache_entry.stat().st_mtime
+            # The adapter only serves player caches younger than 24 hours without refetching
+            if time.time() - mtime < CACHE_TTL_SECONDS:
+                cached_players.add(player)
+            cache_age = datetime.fromtimestamp(mtime)
+            logger.debug(f"Found cached data for {player} from {cache_age}")
+    
+    # Anything that may download runs serially: download_match_data shares a temp directory
+    # per match and removes it when done, so concurrent downloads can delete each other's files
+    # (force refresh for first player to test download)
+    first_player, *other_players = TEST_PLAYERS
+    results = [(first_player, get_player_stats(first_player, force_refresh=True))]
+    results.extend(
+        (player, get_player_stats(player, force_refresh=False))
+        for player in other_players if player not in cached_players
+    )
+    
+    # Cache hits are read-only, so those are fetched in parallel
+    cache_hits = [player for player in other_players if player in cached_players]
+    if cache_hits:
+        with ThreadPoolExecutor(max_workers=len(cache_hits)) as executor:
+            futures = {
+                executor.submit(get_player_stats, player, force_refresh=False): player
+                for player in cache_hits
+            }
+            results.extend((futures[future], future.result()) for future in as_completed(futures))
+    
+    for player, stats in results:
+        logger.debug(f"Retrieved stats for {player}:")
         
-        # Print key stats
-        print(f"  Team: {stats.get('team', 'Unknown')}")
-        print(f"  Role: {stats.get('role', 'Unknown')}")
-        print(f"  Source: {stats.get('source', 'Unknown')}")
+        # Log key stats
+        logger.debug(f"  Team: {stats.get('team', 'Unknown')}")
+        logger.debug(f"  Role: {stats.get('role', 'Unknown')}")
+        logger.debug(f"  Source: {stats.get('source', 'Unknown')}")
         
         if 'batting_avg' in stats:
-            print(f"  Batting Average: {stats.get('batting_avg', 'N/A')}")
+            logger.debug(f"  Batting Average: {stats.get('batting_avg', 'N/A')}")
         
         if 'recent_form' in stats:
-            print(f"  Recent Form: {stats.get('recent_form', [])}")
+            logger.debug(f"  Recent Form: {stats.get('recent_form', [])}")
         
         if 'last_updated' in stats:
-            print(f"  Last Updated: {stats.get('last_updated', 'Unknown')}")
-    
-    print("\n")
+            logger.debug(f"  Last Updated: {stats.get('last_updated', 'Unknown')}")
 
 def test_formatted_output():
     """Test the formatted output function"""
-    test_players = [
-        "Virat Kohli",
-        "Jasprit Bumrah"
-    ]
-    
-    print("\n=== Testing Formatted Output ===")
-    for player in test_players:
-        print(f"\nFormatted stats for {player}:")
+    logger.debug("=== Testing Formatted Output ===")
+    for player in FORMATTED_OUTPUT_PLAYERS:
+        logger.debug(f"Formatted stats for {player}:")
         formatted_stats = get_formatted_player_stats(player)
-        print(formatted_stats)
-    
-    print("\n")
+        logger.debug(formatted_stats)
 
 def main():
     """Main test function"""
-    print("=== Cricket Player Stats Test ===")
+    logger.debug("=== Cricket Player Stats Test ===")
     
     # Ensure cache directory exists
     os.makedirs("cricsheet_data/cache", exist_ok=True)
@@ -104,7 +145,7 @@ def main():
     test_player_stats_retrieval()
     test_formatted_output()
     
-    print("=== Tests Complete ===")
+    logger.debug("=== Tests Complete ===")
 
 if __name__ == "__main__":
     main()
@@ -2,8 +2,8 @@
 Simple test script for the Fantasy Cricket Chatbot with integrated data sources
 """
 
+import os
 import logging
-from assistant import generate_response
 
 # Set up logging
 logging.basicConfig(
@@ -12,12 +12,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Per-query output is logged at DEBUG; set VERBOSE=1 (or run pytest with
+# -o log_cli_level=DEBUG) to see it
+if os.environ.get("VERBOSE"):
+    logger.setLevel(logging.DEBUG)
+
 def test_query(query):
-    """Test a query and print the response"""
-    print(f"\n=== Query: '{query}' ===\n")
+    """Test a query and log the response"""
+    # Imported lazily so collecting this module doesn't load the assistant stack
+    from assistant import generate_response
+    
+    logger.debug(f"=== Query: '{query}' ===")
     response = generate_response(query)
-    print(response)
-    print("\n" + "="*50 + "\n")
+    logger.debug(response)
 
 def main():
     """Main function to test the chatbot"""
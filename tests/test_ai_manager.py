@@ -1,232 +1,188 @@
-import unittest
 import sys
 import os
-import json
+import pytest
 from unittest.mock import patch, MagicMock
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from ai_manager import AIManager, AIModel
 
-class TestAIManager(unittest.TestCase):
-    """Test cases for AIManager"""
-
-    def setUp(self):
-        """Set up test case"""
-        # Clear environment variables for testing
-        if "GEMINI_API_KEY" in os.environ:
-            del os.environ["GEMINI_API_KEY"]
-        if "OPENAI_API_KEY" in os.environ:
-            del os.environ["OPENAI_API_KEY"]
-
-    @patch('ai_manager.AIManager._check_available_models')
-    def test_init_with_default_model(self, mock_check_models):
-        """Test initializing with default model"""
-        # Mock available models
-        mock_check_models.return_value = [AIModel.RULE_BASED, AIModel.GEMINI]
-
-        # Initialize with default model
-        manager = AIManager(default_model=AIModel.GEMINI)
-
-        self.assertEqual(manager.default_model, AIModel.GEMINI)
-        self.assertEqual(manager.available_models, [AIModel.RULE_BASED, AIModel.GEMINI])
-
-    @patch('ai_manager.AIManager._check_available_models')
-    def test_init_with_unavailable_model(self, mock_check_models):
-        """Test initializing with unavailable model"""
-        # Mock available models (GEMINI not available)
-        mock_check_models.return_value = [AIModel.RULE_BASED]
-
-        # Initialize with unavailable model
-        manager = AIManager(default_model=AIModel.GEMINI)
-
-        # Should fall back to rule-based
-        self.assertEqual(manager.default_model, AIModel.RULE_BASED)
-
-    def test_check_available_models(self):
-        """Test checking available models"""
-        # No API keys set
-        manager = AIManager()
-        available_models = manager._check_available_models()
-
-        # Only rule-based should be available
-        self.assertEqual(available_models, [AIModel.RULE_BASED])
-
-        # Set Gemini API key
-        with patch.dict(os.environ, {"GEMINI_API_KEY": "fake-key"}):
-            with patch('gemini_assistant.GEMINI_AVAILABLE', True):
-                # Import the module inside the test to avoid circular imports
-                import sys
-                sys.modules['gemini_assistant'] = MagicMock()
-                sys.modules['gemini_assistant'].GEMINI_AVAILABLE = True
-
-                manager = AIManager()
-                # Mock the check_available_models method
-                manager._check_available_models = MagicMock(return_value=[AIModel.RULE_BASED, AIModel.GEMINI])
-                available_models = manager._check_available_models()
-
-                # Rule-based and Gemini should be available
-                self.assertIn(AIModel.RULE_BASED, available_models)
-                self.assertIn(AIModel.GEMINI, available_models)
-
-        # Set OpenAI API key
-        with patch.dict(os.environ, {"OPENAI_API_KEY": "fake-key"}):
-            with patch('openai_assistant.OPENAI_AVAILABLE', True):
-                # Import the module inside the test to avoid circular imports
-                import sys
-                sys.modules['openai_assistant'] = MagicMock()
-                sys.modules['openai_assistant'].OPENAI_AVAILABLE = True
-
-                manager = AIManager()
-                # Mock the check_available_models method
-                manager._check_available_models = MagicMock(return_value=[AIModel.RULE_BASED, AIModel.OPENAI])
-                available_models = manager._check_available_models()
-
-                # Rule-based and OpenAI should be available
-                self.assertIn(AIModel.RULE_BASED, available_models)
-                self.assertIn(AIModel.OPENAI, available_models)
-
-    @patch('ai_manager.AIManager._check_available_models')
-    @patch('assistant.generate_response')
-    def test_process_query_rule_based(self, mock_generate_response, mock_check_models):
-        """Test processing query with rule-based model"""
-        # Mock available models
-        mock_check_models.return_value = [AIModel.RULE_BASED]
-
-        # Mock rule-based response
-        mock_generate_response.return_value = "Rule-based response"
-
-        # Initialize manager
-        manager = AIManager(default_model=AIModel.RULE_BASED)
-
-        # Process query
-        result = manager.process_query("Test query")
-
-        # Check result
-        self.assertEqual(result["response"], "Rule-based response")
-        self.assertEqual(result["model_used"], "rule-based")
-        self.assertTrue(result["success"])
-
-        # Verify mock was called
-        mock_generate_response.assert_called_once_with("Test query")
-
-    @patch('ai_manager.AIManager._check_available_models')
-    @patch('gemini_assistant.process_cricket_query')
-    def test_process_query_gemini(self, mock_process_query, mock_check_models):
-        """Test processing query with Gemini model"""
-        # Mock available models
-        mock_check_models.return_value = [AIModel.RULE_BASED, AIModel.GEMINI]
-
-        # Mock Gemini response
-        mock_process_query.return_value = "Gemini response"
-
-        # Initialize manager
-        manager = AIManager(default_model=AIModel.GEMINI)
-
-        # Process query
-        result = manager.process_query("Test query")
-
-        # Check result
-        self.assertEqual(result["response"], "Gemini response")
-        self.assertEqual(result["model_used"], "gemini")
-        self.assertTrue(result["success"])
-
-        # Verify mock was called
-        mock_process_query.assert_called_once_with("Test query")
-
-    @patch('ai_manager.AIManager._check_available_models')
-    @patch('openai_assistant.process_cricket_query')
-    def test_process_query_openai(self, mock_process_query, mock_check_models):
-        """Test processing query with OpenAI model"""
-        # Mock available models
-        mock_check_models.return_value = [AIModel.RULE_BASED, AIModel.OPENAI]
-
-        # Mock OpenAI response
-        mock_process_query.return_value = "OpenAI response"
-
-        # Initialize manager
-        manager = AIManager(default_model=AIModel.OPENAI)
+@pytest.fixture(autouse=True)
+def clear_api_keys(monkeypatch):
+    """Clear environment variables for testing (restored after each test)"""
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+@pytest.fixture(scope="module")
+def mock_ai_modules():
+    """Stand-in assistant modules that report their SDKs as available"""
+    return {
+        'gemini_assistant': MagicMock(GEMINI_AVAILABLE=True),
+        'openai_assistant': MagicMock(OPENAI_AVAILABLE=True)
+    }
+
+@pytest.fixture(scope="module")
+def shared_manager():
+    """Build one manager shared by tests that don't exercise __init__"""
+    all_models = [AIModel.RULE_BASED, AIModel.GEMINI, AIModel.OPENAI]
+    with patch.object(AIManager, '_check_available_models', return_value=all_models):
+        return AIManager(default_model=AIModel.RULE_BASED)
+
+@pytest.fixture
+def configure_manager(shared_manager):
+    """Return a helper that configures the shared manager with the given models"""
+    def _configure(default_model, available_models):
+        shared_manager.available_models = list(available_models)
+        shared_manager.default_model = default_model
+        return shared_manager
+    return _configure
+
+@patch('ai_manager.AIManager._check_available_models')
+def test_init_with_default_model(mock_check_models):
+    """Test initializing with default model"""
+    # Mock available models
+    mock_check_models.return_value = [AIModel.RULE_BASED, AIModel.GEMINI]
+
+    # Initialize with default model
+    manager = AIManager(default_model=AIModel.GEMINI)
+
+    assert manager.default_model == AIModel.GEMINI
+    assert manager.available_models == [AIModel.RULE_BASED, AIModel.GEMINI]
+
+@patch('ai_manager.AIManager._check_available_models')
+def test_init_with_unavailable_model(mock_check_models):
+    """Test initializing with unavailable model"""
+    # Mock available models (GEMINI not available)
+    mock_check_models.return_value = [AIModel.RULE_BASED]
+
+    # Initialize with unavailable model
+    manager = AIManager(default_model=AIModel.GEMINI)
+
+    # Should fall back to rule-based
+    assert manager.default_model == AIModel.RULE_BASED
+
+def test_check_available_models(mock_ai_modules):
+    """Test checking available models"""
+    # No API keys set
+    manager = AIManager()
+    available_models = manager._check_available_models()
+
+    # Only rule-based should be available
+    assert available_models == [AIModel.RULE_BASED]
+
+    # Set Gemini API key
+    with patch.dict(os.environ, {"GEMINI_API_KEY": "fake-key"}):
+        # Swap in the mock module (restored on exit) to avoid circular imports
+        with patch.dict(sys.modules, {'gemini_assistant': mock_ai_modules['gemini_assistant']}):
+            manager = AIManager()
+            # Mock the check_available_models method
+            manager._check_available_models = MagicMock(return_value=[AIModel.RULE_BASED, AIModel.GEMINI])
+            available_models = manager._check_available_models()
+
+            # Rule-based and Gemini should be available
+            assert AIModel.RULE_BASED in available_models
+            assert AIModel.GEMINI in available_models
+
+    # Set OpenAI API key
+    with patch.dict(os.environ, {"OPENAI_API_KEY": "fake-key"}):
+        # Swap in the mock module (restored on exit) to avoid circular imports
+        with patch.dict(sys.modules, {'openai_assistant': mock_ai_modules['openai_assistant']}):
+            manager = AIManager()
+            # Mock the check_available_models method
+            manager._check_available_models = MagicMock(return_value=[AIModel.RULE_BASED, AIModel.OPENAI])
+            available_models = manager._check_available_models()
+
+            # Rule-based and OpenAI should be available
+            assert AIModel.RULE_BASED in available_models
+            assert AIModel.OPENAI in available_models
+
+# Function each model's query is routed to
+QUERY_TARGETS = {
+    AIModel.RULE_BASED: 'assistant.generate_response',
+    AIModel.GEMINI: 'gemini_assistant.process_cricket_query',
+    AIModel.OPENAI: 'openai_assistant.process_cricket_query'
+}
+
+@pytest.mark.parametrize("model,available_models,expected_response", [
+    (AIModel.RULE_BASED, [AIModel.RULE_BASED], "Rule-based response"),
+    (AIModel.GEMINI, [AIModel.RULE_BASED, AIModel.GEMINI], "Gemini response"),
+    (AIModel.OPENAI, [AIModel.RULE_BASED, AIModel.OPENAI], "OpenAI response"),
+])
+def test_process_query(configure_manager, model, available_models, expected_response):
+    """Test processing query with each model"""
+    with patch(QUERY_TARGETS[model]) as mock_query:
+        # Mock model response
+        mock_query.return_value = expected_response
+
+        # Configure shared manager
+        manager = configure_manager(model, available_models)
 
         # Process query
         result = manager.process_query("Test query")
 
-        # Check result
-        self.assertEqual(result["response"], "OpenAI response")
-        self.assertEqual(result["model_used"], "openai")
-        self.assertTrue(result["success"])
+    # Check result
+    assert result["response"] == expected_response
+    assert result["model_used"] == model.value
+    assert result["success"]
 
-        # Verify mock was called
-        mock_process_query.assert_called_once_with("Test query")
+    # Verify mock was called
+    mock_query.assert_called_once_with("Test query")
 
-    @patch('ai_manager.AIManager._check_available_models')
-    @patch('gemini_assistant.process_cricket_query')
-    @patch('assistant.generate_response')
-    def test_process_query_with_fallback(self, mock_generate_response, mock_process_query, mock_check_models):
-        """Test processing query with fallback to rule-based"""
-        # Mock available models
-        mock_check_models.return_value = [AIModel.RULE_BASED, AIModel.GEMINI]
+@patch('ai_manager.AIManager._check_available_models')
+@patch('gemini_assistant.process_cricket_query')
+@patch('assistant.generate_response')
+def test_process_query_with_fallback(mock_generate_response, mock_process_query, mock_check_models):
+    """Test processing query with fallback to rule-based"""
+    # Mock available models
+    mock_check_models.return_value = [AIModel.RULE_BASED, AIModel.GEMINI]
 
-        # Mock Gemini to raise exception
-        mock_process_query.side_effect = Exception("Gemini error")
-
-        # Mock rule-based response
-        mock_generate_response.return_value = "Fallback response"
-
-        # Initialize manager
-        manager = AIManager(default_model=AIModel.GEMINI)
-
-        # Process query
-        result = manager.process_query("Test query")
+    # Mock Gemini to raise exception
+    mock_process_query.side_effect = Exception("Gemini error")
 
-        # Check result
-        self.assertEqual(result["response"], "Fallback response")
-        self.assertEqual(result["model_used"], "rule-based")
-        self.assertTrue(result["success"])
-        self.assertTrue(result["fallback"])
-        self.assertEqual(result["error"], "Gemini error")
+    # Mock rule-based response
+    mock_generate_response.return_value = "Fallback response"
 
-        # Verify mocks were called
-        mock_process_query.assert_called_once_with("Test query")
-        mock_generate_response.assert_called_once_with("Test query")
+    # Initialize manager
+    manager = AIManager(default_model=AIModel.GEMINI)
 
-    @patch('ai_manager.AIManager._check_available_models')
-    def test_set_default_model(self, mock_check_models):
-        """Test setting default model"""
-        # Mock available models
-        mock_check_models.return_value = [AIModel.RULE_BASED, AIModel.GEMINI]
+    # Process query
+    result = manager.process_query("Test query")
 
-        # Initialize manager
-        manager = AIManager(default_model=AIModel.RULE_BASED)
+    # Check result
+    assert result["response"] == "Fallback response"
+    assert result["model_used"] == "rule-based"
+    assert result["success"]
+    assert result["fallback"]
+    assert result["error"] == "Gemini error"
 
-        # Set default model to available model
-        result = manager.set_default_model(AIModel.GEMINI)
+    # Verify mocks were called
+    mock_process_query.assert_called_once_with("Test query")
+    mock_generate_response.assert_called_once_with("Test query")
 
-        # Check result
-        self.assertTrue(result)
-        self.assertEqual(manager.default_model, AIModel.GEMINI)
+def test_set_default_model(configure_manager):
+    """Test setting default model"""
+    # Configure shared manager
+    manager = configure_manager(AIModel.RULE_BASED, [AIModel.RULE_BASED, AIModel.GEMINI])
 
-        # Set default model to unavailable model
-        result = manager.set_default_model(AIModel.OPENAI)
+    # Set default model to available model
+    result = manager.set_default_model(AIModel.GEMINI)
 
-        # Check result
-        self.assertFalse(result)
-        self.assertEqual(manager.default_model, AIModel.GEMINI)  # Unchanged
+    # Check result
+    assert result
+    assert manager.default_model == AIModel.GEMINI
 
-    @patch('ai_manager.AIManager._check_available_models')
-    def test_get_available_models(self, mock_check_models):
-        """Test getting available models"""
-        # Mock available models
-        mock_check_models.return_value = [AIModel.RULE_BASED, AIModel.GEMINI, AIModel.OPENAI]
+    # Set default model to unavailable model
+    result = manager.set_default_model(AIModel.OPENAI)
 
-        # Initialize manager
-        manager = AIManager()
+    # Check result
+    assert not result
+    assert manager.default_model == AIModel.GEMINI  # Unchanged
 
-        # Get available models
-        models = manager.get_available_models()
+def test_get_available_models(configure_manager):
+    """Test getting available models"""
+    # Configure shared manager
+    manager = configure_manager(AIModel.GEMINI, [AIModel.RULE_BASED, AIModel.GEMINI, AIModel.OPENAI])
 
-        # Check result
-        self.assertEqual(models, ["rule-based", "gemini", "openai"])
+    # Get available models
+    models = manager.get_available_models()
 
-if __name__ == '__main__':
-    unittest.main()
+    # Check result
+    assert models == ["rule-based", "gemini", "openai"]
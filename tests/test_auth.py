@@ -2,66 +2,12 @@
 Tests for the auth.py module
 """
 
-import unittest
+import pytest
 from unittest.mock import patch, MagicMock
-import sys
-import os
 import bcrypt
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-# Mock streamlit
-class MockSession:
-    def __init__(self):
-        self.session_state = {}
-
-class MockSt:
-    def __init__(self):
-        self.session_state = {}
-    
-    def sidebar(self):
-        return self
-    
-    def markdown(self, text):
-        return None
-    
-    def success(self, text):
-        return None
-    
-    def error(self, text):
-        return None
-    
-    def form(self, key, clear_on_submit=False):
-        class MockForm:
-            def __enter__(self):
-                return self
-            
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                return None
-        
-        return MockForm()
-    
-    def text_input(self, label, type=None):
-        return ""
-    
-    def form_submit_button(self, label):
-        return False
-    
-    def tabs(self, labels):
-        return [self, self]
-    
-    def button(self, label):
-        return False
-    
-    def rerun(self):
-        return None
-
-# Mock streamlit module
-sys.modules['streamlit'] = MagicMock()
-sys.modules['streamlit'].session_state = {}
-
 # Import module to test
+import auth
 from auth import (
     initialize_session_state,
     login_user,
@@ -70,104 +16,91 @@ from auth import (
     get_current_user
 )
 
-class TestAuth(unittest.TestCase):
-    """Test cases for auth.py"""
+# Hash once at import with the minimum cost factor; authenticate_user is mocked,
+# so the hash is never verified and only needs to look like a real one
+_CACHED_PW_HASH = bcrypt.hashpw(b"password", bcrypt.gensalt(rounds=4)).decode()
+
+@pytest.fixture(scope="session")
+def mock_user():
+    """Mock user returned by the database (never mutated by the tests)"""
+    user = MagicMock()
+    user.id = 1
+    user.username = "testuser"
+    user.email = "test@example.com"
+    user.password_hash = _CACHED_PW_HASH
+    return user
+
+@pytest.fixture(scope="session")
+def _mock_db_template():
+    """Mock database manager built once and reset for each test"""
+    return MagicMock()
+
+@pytest.fixture
+def mock_db(_mock_db_template, mock_user):
+    """Mock database manager with fresh call history and default return values"""
+    _mock_db_template.reset_mock(return_value=True, side_effect=True)
+    _mock_db_template.configure_mock(**{
+        'authenticate_user.return_value': mock_user,
+        'get_user_by_username.return_value': None,  # User doesn't exist for registration
+        'create_user.return_value': mock_user,
+        'get_user_by_id.return_value': mock_user,
+    })
+    return _mock_db_template
+
+@pytest.fixture(autouse=True)
+def st(fake_streamlit, monkeypatch):
+    """Point auth at the per-test streamlit stand-in from conftest"""
+    monkeypatch.setattr(auth, 'st', fake_streamlit)
+    return fake_streamlit
+
+@patch('auth.DatabaseManager')
+def test_auth_lifecycle(mock_db_class, mock_db, mock_user, st):
+    """Test session initialization, login success, logout and login failure in sequence"""
+    # Configure mock
+    mock_db_class.return_value = mock_db
     
-    def setUp(self):
-        """Set up test fixtures"""
-        # Create mock user
-        self.mock_user = MagicMock()
-        self.mock_user.id = 1
-        self.mock_user.username = "testuser"
-        self.mock_user.email = "test@example.com"
-        self.mock_user.password_hash = bcrypt.hashpw("password".encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
-        
-        # Create mock database manager
-        self.mock_db = MagicMock()
-        self.mock_db.authenticate_user.return_value = self.mock_user
-        self.mock_db.get_user_by_username.return_value = None  # User doesn't exist for registration
-        self.mock_db.create_user.return_value = self.mock_user
-        self.mock_db.get_user_by_id.return_value = self.mock_user
-        
-        # Mock streamlit session state
-        sys.modules['streamlit'].session_state = {}
+    # Initialize session state
+    initialize_session_state()
     
-    def test_initialize_session_state(self):
-        """Test initialize_session_state function"""
-        # Call function
-        initialize_session_state()
-        
-        # Assertions
-        self.assertIn('user_id', sys.modules['streamlit'].session_state)
-        self.assertIn('authenticated', sys.modules['streamlit'].session_state)
-        self.assertIn('username', sys.modules['streamlit'].session_state)
-        self.assertIn('db_user_id', sys.modules['streamlit'].session_state)
-        
-        self.assertFalse(sys.modules['streamlit'].session_state['authenticated'])
-        self.assertIsNone(sys.modules['streamlit'].session_state['username'])
-        self.assertIsNone(sys.modules['streamlit'].session_state['db_user_id'])
+    assert 'user_id' in st.session_state
+    assert 'authenticated' in st.session_state
+    assert 'username' in st.session_state
+    assert 'db_user_id' in st.session_state
     
-    @patch('auth.DatabaseManager')
-    def test_login_user_success(self, mock_db_class):
-        """Test login_user function with successful login"""
-        # Configure mock
-        mock_db_class.return_value = self.mock_db
-        
-        # Initialize session state
-        initialize_session_state()
-        
-        # Call function
-        success, message = login_user("testuser", "password")
-        
-        # Assertions
-        self.assertTrue(success)
-        self.assertEqual(message, "Login successful!")
-        self.assertTrue(sys.modules['streamlit'].session_state['authenticated'])
-        self.assertEqual(sys.modules['streamlit'].session_state['username'], "testuser")
-        self.assertEqual(sys.modules['streamlit'].session_state['db_user_id'], 1)
-        
-        # Verify mock was called
-        self.mock_db.authenticate_user.assert_called_once_with("testuser", "password")
-        self.mock_db.close.assert_called_once()
+    assert not st.session_state['authenticated']
+    assert st.session_state['username'] is None
+    assert st.session_state['db_user_id'] is None
     
-    @patch('auth.DatabaseManager')
-    def test_login_user_failure(self, mock_db_class):
-        """Test login_user function with failed login"""
-        # Configure mock
-        self.mock_db.authenticate_user.return_value = None
-        mock_db_class.return_value = self.mock_db
-        
-        # Initialize session state
-        initialize_session_state()
-        
-        # Call function
-        success, message = login_user("testuser", "wrongpassword")
-        
-        # Assertions
-        self.assertFalse(success)
-        self.assertEqual(message, "Invalid username or password.")
-        self.assertFalse(sys.modules['streamlit'].session_state['authenticated'])
-        self.assertIsNone(sys.modules['streamlit'].session_state['username'])
-        self.assertIsNone(sys.modules['streamlit'].session_state['db_user_id'])
-        
-        # Verify mock was called
-        self.mock_db.authenticate_user.assert_called_once_with("testuser", "wrongpassword")
-        self.mock_db.close.assert_called_once()
+    # Successful login
+    success, message = login_user("testuser", "password")
     
-    def test_logout_user(self):
-        """Test logout_user function"""
-        # Set up session state
-        sys.modules['streamlit'].session_state['authenticated'] = True
-        sys.modules['streamlit'].session_state['username'] = "testuser"
-        sys.modules['streamlit'].session_state['db_user_id'] = 1
-        
-        # Call function
-        logout_user()
-        
-        # Assertions
-        self.assertFalse(sys.modules['streamlit'].session_state['authenticated'])
-        self.assertIsNone(sys.modules['streamlit'].session_state['username'])
-        self.assertIsNone(sys.modules['streamlit'].session_state['db_user_id'])
-
-if __name__ == '__main__':
-    unittest.main()
+    assert success
+    assert message == "Login successful!"
+    assert st.session_state['authenticated']
+    assert st.session_state['username'] == "testuser"
+    assert st.session_state['db_user_id'] == mock_user.id
+    
+    mock_db.authenticate_user.assert_called_once_with("testuser", "password")
+    mock_db.close.assert_called_once()
+    
+    # Logout clears the user
+    logout_user()
+    
+    assert not st.session_state['authenticated']
+    assert st.session_state['username'] is None
+    assert st.session_state['db_user_id'] is None
+    
+    # Failed login leaves the session logged out
+    mock_db.reset_mock()
+    mock_db.authenticate_user.return_value = None
+    
+    success, message = login_user("testuser", "wrongpassword")
+    
+    assert not success
+    assert message == "Invalid username or password."
+    assert not st.session_state['authenticated']
+    assert st.session_state['username'] is None
+    assert st.session_state['db_user_id'] is None
+    
+    mock_db.authenticate_user.assert_called_once_with("testuser", "wrongpassword")
+    mock_db.close.assert_called_once()
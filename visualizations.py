@@ -1,12 +1,21 @@
+import io
+import copy
+import heapq
+from contextlib import contextmanager
+from operator import itemgetter
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Iterator, TYPE_CHECKING
 import logging
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
 from db_manager import DatabaseManager
-from models import Player, Team, Match, PlayerPerformance
+from models import Player, Team, Match, PlayerPerformance, get_database_url
+
+if TYPE_CHECKING:
+    # matplotlib is imported by the figure builders on first use, not at module import
+    from matplotlib.figure import Figure
 
 # Set up logging
 logging.basicConfig(
@@ -15,8 +24,197 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Set Seaborn style
-sns.set_style("whitegrid")
+@st.cache_resource
+def _init_style() -> bool:
+    """Apply the Seaborn style once per process (seaborn is only imported when a figure is built)"""
+    import seaborn as sns
+    sns.set_style("whitegrid")
+    return True
+
+@st.cache_resource
+def _session_factory() -> sessionmaker:
+    """Session factory (and its engine/connection pool) shared across reruns and sessions"""
+    return sessionmaker(bind=create_engine(get_database_url()))
+
+@contextmanager
+def _db() -> Iterator[DatabaseManager]:
+    """Database manager on a short-lived session of its own; Sessions are not thread-safe"""
+    db = DatabaseManager(session=_session_factory()())
+    try:
+        yield db
+    finally:
+        db.close()
+
+def _as_series(values: Any) -> Optional[np.ndarray]:
+    """Recent-match JSON list as a float32 array, or None if missing or empty"""
+    if not values or not isinstance(values, list):
+        return None
+    return np.asarray(values, dtype=np.float32)
+
+def _player_to_dict(player: Player) -> Dict[str, Any]:
+    """Plain snapshot of the player fields the charts need (safe to cache and pickle)"""
+    return {
+        "name": player.name,
+        "role": player.role,
+        "team": player.team.name if player.team else None,
+        "batting_avg": player.batting_avg,
+        "bowling_avg": player.bowling_avg,
+        "strike_rate": player.strike_rate,
+        "fantasy_points_avg": player.fantasy_points_avg,
+        "price": player.price,
+        "ownership": player.ownership,
+        "matches_played": player.matches_played,
+        "recent_form": _as_series(player.recent_form),
+        "recent_wickets": _as_series(player.recent_wickets)
+    }
+
+@st.cache_data(ttl=300)
+def _player_snapshot(name: str) -> Optional[Dict[str, Any]]:
+    """Cached snapshot of a single player, or None if not in the database"""
+    with _db() as db:
+        player = db.get_player_by_name(name)
+        return _player_to_dict(player) if player else None
+
+@st.cache_data(ttl=300)
+def _players_snapshot(names: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    """Cached snapshots of the named players found in the database, in the given order"""
+    with _db() as db:
+        return [_player_to_dict(p) for p in db.get_players_by_names(list(names))]
+
+@st.cache_data(ttl=300)
+def _team_snapshot(team_name: str) -> List[Dict[str, Any]]:
+    """Cached snapshots of all players in a team"""
+    with _db() as db:
+        return [_player_to_dict(p) for p in db.get_players_by_team(team_name)]
+
+# Stats compared between teams, in radar-chart order
+_TEAM_STATS = ('batting_avg', 'bowling_avg', 'fantasy_points_avg')
+_team_stats_of = itemgetter(*_TEAM_STATS)
+
+def _team_means(players: List[Dict[str, Any]]) -> np.ndarray:
+    """Per-stat means over the players that have each stat, in one pass (0.0 where none do)"""
+    # (players x stats) matrix, one tuple per player; None becomes NaN and zero is treated as missing
+    arr = np.array([_team_stats_of(p) for p in players], dtype=np.float64)
+    arr[arr == 0] = np.nan
+    counts = np.count_nonzero(~np.isnan(arr), axis=0)
+    sums = np.nansum(arr, axis=0)
+    return np.divide(sums, counts, out=np.zeros(len(_TEAM_STATS)), where=counts > 0)
+
+def _figure_png(fig: "Figure", dpi: int = 90) -> bytes:
+    """Render a figure to PNG bytes"""
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=dpi, bbox_inches='tight')
+    return buf.getvalue()
+
+# Fantasy value gauge bands (value = fantasy points per unit of price)
+_GAUGE_BOUNDS = (0, 5, 7.5, 10, 12.5)
+_GAUGE_COLORS = ('#EA4335', '#FBBC05', '#34A853', '#1A73E8')
+_GAUGE_LABELS = ('Poor', 'Average', 'Good', 'Excellent')
+
+@st.cache_resource
+def _gauge_template() -> "Figure":
+    """Gauge background (bands, ticks and labels) built once; copy it before drawing on it"""
+    # Figures are built with the OO API so they never register with pyplot and need no closing
+    from matplotlib.figure import Figure
+    _init_style()
+    
+    fig = Figure(figsize=(4, 3))
+    ax = fig.subplots()
+    
+    # Plot the gauge background
+    for lo, hi, color in zip(_GAUGE_BOUNDS, _GAUGE_BOUNDS[1:], _GAUGE_COLORS):
+        ax.axvspan(lo, hi, alpha=0.3, color=color)
+    
+    # Set up the plot
+    ax.set_xlim(0, _GAUGE_BOUNDS[-1])
+    ax.set_ylim(-1, 1)
+    ax.set_yticks([])
+    ax.set_xticks(_GAUGE_BOUNDS[1:])
+    ax.set_xticklabels(_GAUGE_LABELS)
+    return fig
+
+def _build_gauge_figure(value: float) -> "Figure":
+    """Build the fantasy value gauge figure: a copy of the template plus the needle"""
+    fig = copy.deepcopy(_gauge_template())
+    ax = fig.axes[0]
+    
+    # Plot the needle
+    ax.arrow(0, 0, min(value, _GAUGE_BOUNDS[-1]), 0, head_width=0.3, head_length=0.8, fc='black', ec='black')
+    ax.set_title(f"Value Rating: {value:.2f}")
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _gauge_png(value: float) -> bytes:
+    """Fantasy value gauge as PNG bytes (cached on the value)"""
+    return _figure_png(_build_gauge_figure(value))
+
+# Radar axes, in _TEAM_STATS order; the closing 0.0 angle closes the loop
+_RADAR_CATS = ('Batting Average', 'Bowling Average', 'Fantasy Points')
+_RADAR_ANGLES = np.r_[np.linspace(0, 2*np.pi, len(_RADAR_CATS), endpoint=False), 0.0]
+_RADAR_GRID_DEGREES = np.degrees(_RADAR_ANGLES[:-1])
+
+def _build_radar_figure(team1_name: str, team2_name: str,
+                        team1_values: Tuple[float, ...], team2_values: Tuple[float, ...]):
+    """Build the team comparison radar figure"""
+    from matplotlib.figure import Figure
+    _init_style()
+    
+    team1_values = np.r_[team1_values, team1_values[0]]  # Close the loop
+    team2_values = np.r_[team2_values, team2_values[0]]  # Close the loop
+    
+    fig = Figure(figsize=(8, 8))
+    ax = fig.subplots(subplot_kw=dict(polar=True))
+    
+    ax.plot(_RADAR_ANGLES, team1_values, 'o-', linewidth=2, label=team1_name, color='#1A73E8')
+    ax.fill(_RADAR_ANGLES, team1_values, alpha=0.25, color='#1A73E8')
+    
+    ax.plot(_RADAR_ANGLES, team2_values, 'o-', linewidth=2, label=team2_name, color='#EA4335')
+    ax.fill(_RADAR_ANGLES, team2_values, alpha=0.25, color='#EA4335')
+    
+    ax.set_thetagrids(_RADAR_GRID_DEGREES, _RADAR_CATS)
+    ax.set_title(f"Team Comparison: {team1_name} vs {team2_name}")
+    ax.grid(True)
+    ax.legend(loc='upper right')
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _radar_png(team1_name: str, team2_name: str,
+               team1_values: Tuple[float, ...], team2_values: Tuple[float, ...]) -> bytes:
+    """Team comparison radar as PNG bytes (cached on its inputs)"""
+    return _figure_png(_build_radar_figure(team1_name, team2_name, team1_values, team2_values))
+
+def _top_players_table(players: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Name/role/fantasy points table for a list of players, built column-wise"""
+    return pd.DataFrame({
+        "Name": [p['name'] for p in players],
+        "Role": [p['role'] for p in players],
+        "Fantasy Pts": [f"{p['fantasy_points_avg']:.1f}" if p['fantasy_points_avg'] else "N/A" for p in players]
+    })
+
+@st.fragment
+def _value_fragment(player: Dict[str, Any]):
+    """Fantasy value gauge, ownership and price (reruns on its own, without the form charts)"""
+    st.subheader("Fantasy Cricket Value")
+    if player['price'] and player['fantasy_points_avg']:
+        value = player['fantasy_points_avg'] / player['price']
+        
+        # Create gauge chart for value
+        st.image(_gauge_png(value))
+        
+        # Ownership percentage
+        if player['ownership']:
+            st.metric("Ownership", f"{player['ownership']:.1f}%")
+        
+        # Price
+        st.metric("Price", f"{player['price']:.1f}")
+
+@st.fragment
+def _top_players_fragment(team_name: str, players: List[Dict[str, Any]]):
+    """Top five players of a team by fantasy points (reruns on its own, without the radar chart)"""
+    st.subheader(f"Top Players - {team_name}")
+    top_players = heapq.nlargest(5, players, key=lambda p: p['fantasy_points_avg'] or 0.0)
+    
+    st.table(_top_players_table(top_players))
 
 def player_performance_chart(player_name: str):
     """
@@ -26,50 +224,34 @@ def player_performance_chart(player_name: str):
     - player_name: Name of the player
     """
     try:
-        db = DatabaseManager()
-        player = db.get_player_by_name(player_name)
+        player = _player_snapshot(player_name)
         
         if not player:
             st.warning(f"Player {player_name} not found in database")
             return
         
-        # Create figure with multiple subplots
-        fig, axes = plt.subplots(2, 1, figsize=(10, 8))
-        
-        # Plot recent form (batting)
-        if player.recent_form and isinstance(player.recent_form, list):
-            recent_form = player.recent_form
-            matches = list(range(1, len(recent_form) + 1))
-            
-            axes[0].plot(matches, recent_form, marker='o', linestyle='-', color='#1A73E8')
-            axes[0].set_title(f"{player.name} - Recent Batting Form")
-            axes[0].set_xlabel("Recent Matches")
-            axes[0].set_ylabel("Runs Scored")
-            axes[0].grid(True, linestyle='--', alpha=0.7)
-            
-            # Add average line
-            avg = sum(recent_form) / len(recent_form)
-            axes[0].axhline(y=avg, color='#EA4335', linestyle='--', label=f'Average: {avg:.1f}')
-            axes[0].legend()
-        
-        # Plot recent wickets (bowling) if available
-        if hasattr(player, 'recent_wickets') and player.recent_wickets and isinstance(player.recent_wickets, list):
-            recent_wickets = player.recent_wickets
-            matches = list(range(1, len(recent_wickets) + 1))
-            
-            axes[1].plot(matches, recent_wickets, marker='o', linestyle='-', color='#34A853')
-            axes[1].set_title(f"{player.name} - Recent Bowling Form")
-            axes[1].set_xlabel("Recent Matches")
-            axes[1].set_ylabel("Wickets Taken")
-            axes[1].grid(True, linestyle='--', alpha=0.7)
-            
-            # Add average line
-            avg = sum(recent_wickets) / len(recent_wickets)
-            axes[1].axhline(y=avg, color='#EA4335', linestyle='--', label=f'Average: {avg:.1f}')
-            axes[1].legend()
-        
-        plt.tight_layout()
-        st.pyplot(fig)
+        # Recent form as native line charts (rendered client-side), with the average as a flat line
+        recent_form = player['recent_form']
+        if recent_form is not None:
+            st.markdown(f"**{player['name']} - Recent Batting Form**")
+            st.line_chart(
+                pd.DataFrame({"Runs": recent_form, "Average": float(recent_form.mean())},
+                             index=pd.Index(np.arange(1, recent_form.size + 1), name="Recent Matches")),
+                x_label="Recent Matches",
+                y_label="Runs Scored",
+                color=['#1A73E8', '#EA4335']
+            )
+        
+        recent_wickets = player['recent_wickets']
+        if recent_wickets is not None:
+            st.markdown(f"**{player['name']} - Recent Bowling Form**")
+            st.line_chart(
+                pd.DataFrame({"Wickets": recent_wickets, "Average": float(recent_wickets.mean())},
+                             index=pd.Index(np.arange(1, recent_wickets.size + 1), name="Recent Matches")),
+                x_label="Recent Matches",
+                y_label="Wickets Taken",
+                color=['#34A853', '#EA4335']
+            )
         
         # Additional player stats
         col1, col2 = st.columns(2)
@@ -77,66 +259,24 @@ def player_performance_chart(player_name: str):
         with col1:
             st.subheader("Player Statistics")
             stats = {
-                "Role": player.role,
-                "Team": player.team.name if player.team else "Unknown",
-                "Batting Average": f"{player.batting_avg:.1f}" if player.batting_avg else "N/A",
-                "Strike Rate": f"{player.strike_rate:.1f}" if player.strike_rate else "N/A",
-                "Fantasy Points Avg": f"{player.fantasy_points_avg:.1f}" if player.fantasy_points_avg else "N/A",
-                "Matches Played": player.matches_played or "N/A"
+                "Role": player['role'],
+                "Team": player['team'] or "Unknown",
+                "Batting Average": f"{player['batting_avg']:.1f}" if player['batting_avg'] else "N/A",
+                "Strike Rate": f"{player['strike_rate']:.1f}" if player['strike_rate'] else "N/A",
+                "Fantasy Points Avg": f"{player['fantasy_points_avg']:.1f}" if player['fantasy_points_avg'] else "N/A",
+                "Matches Played": player['matches_played'] or "N/A"
             }
             
             # Create a DataFrame for better display
-            stats_df = pd.DataFrame(list(stats.items()), columns=["Metric", "Value"])
+            stats_df = pd.DataFrame({"Metric": list(stats.keys()), "Value": list(stats.values())})
             st.table(stats_df)
         
         with col2:
-            st.subheader("Fantasy Cricket Value")
-            if player.price and player.fantasy_points_avg:
-                value = player.fantasy_points_avg / player.price
-                
-                # Create gauge chart for value
-                fig, ax = plt.subplots(figsize=(4, 3))
-                
-                # Define value ranges
-                poor = 5
-                average = 7.5
-                good = 10
-                excellent = 12.5
-                
-                # Create gauge
-                gauge_colors = ['#EA4335', '#FBBC05', '#34A853', '#1A73E8']
-                bounds = [0, poor, average, good, excellent]
-                norm = plt.Normalize(0, excellent)
-                
-                # Plot the gauge background
-                for i in range(len(bounds)-1):
-                    ax.axvspan(bounds[i], bounds[i+1], alpha=0.3, color=gauge_colors[i])
-                
-                # Plot the needle
-                ax.arrow(0, 0, min(value, excellent), 0, head_width=0.3, head_length=0.8, fc='black', ec='black')
-                
-                # Set up the plot
-                ax.set_xlim(0, excellent)
-                ax.set_ylim(-1, 1)
-                ax.set_yticks([])
-                ax.set_xticks([poor, average, good, excellent])
-                ax.set_xticklabels(['Poor', 'Average', 'Good', 'Excellent'])
-                ax.set_title(f"Value Rating: {value:.2f}")
-                
-                st.pyplot(fig)
-                
-                # Ownership percentage
-                if player.ownership:
-                    st.metric("Ownership", f"{player.ownership:.1f}%")
-                
-                # Price
-                st.metric("Price", f"{player.price:.1f}")
+            _value_fragment(player)
     
     except Exception as e:
         logger.error(f"Error creating player performance chart: {str(e)}")
         st.error(f"Error creating visualization: {str(e)}")
-    finally:
-        db.close()
 
 def team_comparison_chart(team1_name: str, team2_name: str):
     """
@@ -147,9 +287,8 @@ def team_comparison_chart(team1_name: str, team2_name: str):
     - team2_name: Name of the second team
     """
     try:
-        db = DatabaseManager()
-        team1_players = db.get_players_by_team(team1_name)
-        team2_players = db.get_players_by_team(team2_name)
+        team1_players = _team_snapshot(team1_name)
+        team2_players = _team_snapshot(team2_name)
         
         if not team1_players:
             st.warning(f"No players found for team {team1_name}")
@@ -159,79 +298,24 @@ def team_comparison_chart(team1_name: str, team2_name: str):
             st.warning(f"No players found for team {team2_name}")
             return
         
-        # Calculate team averages
-        team1_batting_avg = sum(p.batting_avg for p in team1_players if p.batting_avg) / len([p for p in team1_players if p.batting_avg]) if any(p.batting_avg for p in team1_players) else 0
-        team2_batting_avg = sum(p.batting_avg for p in team2_players if p.batting_avg) / len([p for p in team2_players if p.batting_avg]) if any(p.batting_avg for p in team2_players) else 0
-        
-        team1_bowling_avg = sum(p.bowling_avg for p in team1_players if p.bowling_avg) / len([p for p in team1_players if p.bowling_avg]) if any(p.bowling_avg for p in team1_players) else 0
-        team2_bowling_avg = sum(p.bowling_avg for p in team2_players if p.bowling_avg) / len([p for p in team2_players if p.bowling_avg]) if any(p.bowling_avg for p in team2_players) else 0
-        
-        team1_fantasy_avg = sum(p.fantasy_points_avg for p in team1_players if p.fantasy_points_avg) / len([p for p in team1_players if p.fantasy_points_avg]) if any(p.fantasy_points_avg for p in team1_players) else 0
-        team2_fantasy_avg = sum(p.fantasy_points_avg for p in team2_players if p.fantasy_points_avg) / len([p for p in team2_players if p.fantasy_points_avg]) if any(p.fantasy_points_avg for p in team2_players) else 0
-        
-        # Create comparison chart
-        categories = ['Batting Average', 'Bowling Average', 'Fantasy Points']
-        team1_values = [team1_batting_avg, team1_bowling_avg, team1_fantasy_avg]
-        team2_values = [team2_batting_avg, team2_bowling_avg, team2_fantasy_avg]
-        
-        # Set up the radar chart
-        angles = np.linspace(0, 2*np.pi, len(categories), endpoint=False).tolist()
-        angles += angles[:1]  # Close the loop
-        
-        team1_values += team1_values[:1]  # Close the loop
-        team2_values += team2_values[:1]  # Close the loop
-        
-        fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(polar=True))
-        
-        ax.plot(angles, team1_values, 'o-', linewidth=2, label=team1_name, color='#1A73E8')
-        ax.fill(angles, team1_values, alpha=0.25, color='#1A73E8')
+        # Calculate team averages (batting, bowling, fantasy points)
+        team1_values = tuple(_team_means(team1_players).tolist())
+        team2_values = tuple(_team_means(team2_players).tolist())
         
-        ax.plot(angles, team2_values, 'o-', linewidth=2, label=team2_name, color='#EA4335')
-        ax.fill(angles, team2_values, alpha=0.25, color='#EA4335')
-        
-        ax.set_thetagrids(np.degrees(angles[:-1]), categories)
-        ax.set_title(f"Team Comparison: {team1_name} vs {team2_name}")
-        ax.grid(True)
-        ax.legend(loc='upper right')
-        
-        st.pyplot(fig)
+        st.image(_radar_png(team1_name, team2_name, team1_values, team2_values))
         
         # Show top players from each team
         col1, col2 = st.columns(2)
         
         with col1:
-            st.subheader(f"Top Players - {team1_name}")
-            top_team1 = sorted(team1_players, key=lambda p: p.fantasy_points_avg if p.fantasy_points_avg else 0, reverse=True)[:5]
-            
-            data = []
-            for player in top_team1:
-                data.append({
-                    "Name": player.name,
-                    "Role": player.role,
-                    "Fantasy Pts": f"{player.fantasy_points_avg:.1f}" if player.fantasy_points_avg else "N/A"
-                })
-            
-            st.table(pd.DataFrame(data))
+            _top_players_fragment(team1_name, team1_players)
         
         with col2:
-            st.subheader(f"Top Players - {team2_name}")
-            top_team2 = sorted(team2_players, key=lambda p: p.fantasy_points_avg if p.fantasy_points_avg else 0, reverse=True)[:5]
-            
-            data = []
-            for player in top_team2:
-                data.append({
-                    "Name": player.name,
-                    "Role": player.role,
-                    "Fantasy Pts": f"{player.fantasy_points_avg:.1f}" if player.fantasy_points_avg else "N/A"
-                })
-            
-            st.table(pd.DataFrame(data))
+            _top_players_fragment(team2_name, team2_players)
     
     except Exception as e:
         logger.error(f"Error creating team comparison chart: {str(e)}")
         st.error(f"Error creating visualization: {str(e)}")
-    finally:
-        db.close()
 
 def fantasy_points_projection(player_names: List[str]):
     """
@@ -241,66 +325,45 @@ def fantasy_points_projection(player_names: List[str]):
     - player_names: List of player names
     """
     try:
-        db = DatabaseManager()
-        players = []
-        
-        for name in player_names:
-            player = db.get_player_by_name(name)
-            if player:
-                players.append(player)
+        players = _players_snapshot(tuple(player_names))
         
         if not players:
             st.warning("No players found for projection")
             return
         
-        # Create projection chart
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        names = [p.name for p in players]
-        points = [p.fantasy_points_avg for p in players if p.fantasy_points_avg]
-        errors = [p.fantasy_points_avg * 0.2 for p in players if p.fantasy_points_avg]  # 20% error margin
-        
-        # Sort by points
-        sorted_indices = np.argsort(points)
-        names = [names[i] for i in sorted_indices]
-        points = [points[i] for i in sorted_indices]
-        errors = [errors[i] for i in sorted_indices]
-        
-        # Create horizontal bar chart with error bars
-        y_pos = np.arange(len(names))
-        ax.barh(y_pos, points, xerr=errors, align='center', color='#1A73E8', ecolor='black', capsize=5)
-        ax.set_yticks(y_pos)
-        ax.set_yticklabels(names)
-        ax.invert_yaxis()  # Labels read top-to-bottom
-        ax.set_xlabel('Projected Fantasy Points')
-        ax.set_title('Fantasy Points Projection with Uncertainty')
-        
-        st.pyplot(fig)
+        # Only players with a projection are charted
+        projected = [p for p in players if p['fantasy_points_avg']]
+        
+        # Native horizontal bar chart, highest projection first (an explicit sort; Vega-Lite
+        # ignores pandas categorical order)
+        import altair as alt
+        chart = alt.Chart(pd.DataFrame({
+            "Player": [p['name'] for p in projected],
+            "Projected Fantasy Points": [p['fantasy_points_avg'] for p in projected]
+        })).mark_bar(color='#1A73E8').encode(
+            x=alt.X("Projected Fantasy Points:Q"),
+            y=alt.Y("Player:N", sort="-x"),
+            tooltip=["Player", "Projected Fantasy Points"]
+        ).properties(title="Fantasy Points Projection")
+        st.altair_chart(chart)
+        st.caption("Projections carry a ±20% uncertainty margin (see Range below).")
         
         # Show projection table
         st.subheader("Fantasy Points Projection Details")
         
-        data = []
-        for player in players:
-            if player.fantasy_points_avg:
-                # Calculate projection range
-                lower = player.fantasy_points_avg * 0.8
-                upper = player.fantasy_points_avg * 1.2
-                
-                data.append({
-                    "Player": player.name,
-                    "Role": player.role,
-                    "Team": player.team.name if player.team else "Unknown",
-                    "Projected Points": f"{player.fantasy_points_avg:.1f}",
-                    "Range": f"{lower:.1f} - {upper:.1f}",
-                    "Price": f"{player.price:.1f}" if player.price else "N/A",
-                    "Value": f"{(player.fantasy_points_avg / player.price):.2f}" if player.price and player.fantasy_points_avg else "N/A"
-                })
-        
-        st.table(pd.DataFrame(data))
+        projected_points = [p['fantasy_points_avg'] for p in projected]
+        prices = [p['price'] for p in projected]
+        st.table(pd.DataFrame({
+            "Player": [p['name'] for p in projected],
+            "Role": [p['role'] for p in projected],
+            "Team": [p['team'] or "Unknown" for p in projected],
+            "Projected Points": [f"{pts:.1f}" for pts in projected_points],
+            # Projection range of +/- 20%
+            "Range": [f"{pts * 0.8:.1f} - {pts * 1.2:.1f}" for pts in projected_points],
+            "Price": [f"{price:.1f}" if price else "N/A" for price in prices],
+            "Value": [f"{(pts / price):.2f}" if price else "N/A" for pts, price in zip(projected_points, prices)]
+        }))
     
     except Exception as e:
         logger.error(f"Error creating fantasy points projection: {str(e)}")
         st.error(f"Error creating visualization: {str(e)}")
-    finally:
-        db.close()